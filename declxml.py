@@ -50,6 +50,7 @@ Exceptions
 .. autoexception:: declxml.InvalidRootProcessor
 .. autoexception:: declxml.MissingValue
 """
+import inspect
 from io import open
 import sys
 from typing import (  # noqa pylint: disable=unused-import
@@ -74,6 +75,25 @@ import xml.etree.ElementTree as ET
 _PY2 = sys.version_info[0] == 2
 
 
+# Number of characters to read at a time when parsing XML files.
+_FILE_CHUNK_SIZE = 64 * 1024
+
+
+# Characters with special meaning in the XPath syntax supported by ElementTree.
+_PATH_SPECIAL_CHARACTERS = frozenset('/.*[]@:{}')
+
+
+# Maps the common spellings of boolean values to their parsed values.
+_BOOLEAN_VALUES = {
+    'true': True,
+    'True': True,
+    'TRUE': True,
+    'false': False,
+    'False': False,
+    'FALSE': False,
+}
+
+
 class XmlError(Exception):
     """Base error class representing errors processing XML data."""
 
@@ -99,6 +119,8 @@ ProcessorLocation = NamedTuple('ProcessorLocation', [
 class ProcessorStateView(object):
     """Provides an immutable view of the processor state."""
 
+    __slots__ = ('_processor_state',)
+
     def __init__(
             self,
             processor_state  # type: _ProcessorState
@@ -192,6 +214,8 @@ class Hooks(object):
 class Processor(object):  # pragma: no cover
     """Abstract protocol for processors."""
 
+    __slots__ = ()
+
     @property
     def alias(self):
         # type: (...) -> Text
@@ -251,6 +275,8 @@ class Processor(object):  # pragma: no cover
 class RootProcessor(Processor):  # pragma: no cover
     """Abstract protocol for root processors."""
 
+    __slots__ = ()
+
     def parse_at_root(
             self,
             root,  # type: ET.Element
@@ -276,39 +302,39 @@ def parse_from_file(
 
     :return: Parsed value.
     """
-    with open(xml_file_path, 'r', encoding=encoding) as xml_file:
-        xml_string = xml_file.read()
+    if not _is_valid_root_processor(root_processor):
+        raise InvalidRootProcessor('Invalid root processor')
 
-    parsed_value = parse_from_string(root_processor, xml_string)
+    # Feed the file to the parser in chunks so that the full text of the document does not
+    # need to be held in memory alongside its element tree.
+    with open(xml_file_path, 'r', encoding=encoding) as xml_file:
+        chunks = iter(lambda: xml_file.read(_FILE_CHUNK_SIZE), '')
+        parsed_value = _parse_chunks(root_processor, chunks)
 
     return parsed_value
 
 
 def parse_from_string(
         root_processor,  # type: RootProcessor
-        xml_string  # type: Text
+        xml_string  # type: Union[Text, bytes]
 ):
     # type: (...) -> Any
     """
     Parse the XML string using the processor starting from the root of the document.
 
-    :param xml_string: XML string to parse.
+    :param xml_string: XML string to parse. May also be the encoded bytes of an XML document,
+        which are handed to the XML parser as-is rather than decoded first. The encoding of the
+        bytes is determined from the document's byte order mark or XML declaration and is
+        UTF-8 if neither is present.
 
     See also :func:`declxml.parse_from_file`
     """
     if not _is_valid_root_processor(root_processor):
         raise InvalidRootProcessor('Invalid root processor')
 
-    parseable_xml_string = xml_string  # type: Union[Text, bytes]
-    if _PY2 and isinstance(xml_string, Text):
-        parseable_xml_string = xml_string.encode('utf-8')
+    root = ET.fromstring(_parseable_text(xml_string))
 
-    root = ET.fromstring(parseable_xml_string)
-    _xml_namespace_strip(root)
-
-    state = _ProcessorState()
-    state.push_location(root_processor.element_path)
-    return root_processor.parse_at_root(root, state)
+    return _parse_root(root_processor, root)
 
 
 def serialize_to_file(
@@ -514,10 +540,9 @@ def floating_point(
 
     See also :func:`declxml.boolean`
     """
-    value_parser = _number_parser(float)
     return _PrimitiveValue(
         element_name,
-        value_parser,
+        _parse_float,
         attribute,
         required,
         alias,
@@ -542,10 +567,9 @@ def integer(
 
     See also :func:`declxml.boolean`
     """
-    value_parser = _number_parser(int)
     return _PrimitiveValue(
         element_name,
-        value_parser,
+        _parse_integer,
         attribute,
         required,
         alias,
@@ -629,6 +653,18 @@ def user_object(
     return _processor_wrap_if_hooks(processor, hooks)
 
 
+# Name of a document's root element paired with a path relative to the root element
+_RootPath = Tuple[Text, Optional[Text]]
+
+
+# Names of the elements along an element path.
+_ElementNames = Tuple[Text, ...]
+
+
+# Function to parse a primitive value from the raw text of an element
+_TextParser = Callable[[Optional[Text], '_ProcessorState'], Any]
+
+
 # Defines pair of functions to convert between aggregates and dictionaries
 _AggregateConverter = NamedTuple('_AggregateConverter', [
     ('from_dict', Callable[[Dict], Any]),
@@ -639,6 +675,14 @@ _AggregateConverter = NamedTuple('_AggregateConverter', [
 class _Aggregate(RootProcessor):
     """An XML processor for processing aggregates."""
 
+    __slots__ = (
+        '_alias',
+        '_converter',
+        '_dictionary',
+        '_element_path',
+        '_required',
+    )
+
     def __init__(
             self,
             element_path,  # type: Text
@@ -648,14 +692,14 @@ class _Aggregate(RootProcessor):
             alias=None  # type: Optional[Text]
     ):
         # type: (...) -> None
-        self._element_path = element_path
+        self._element_path = _intern(element_path)
         self._converter = converter
         self._required = required
         self._dictionary = _Dictionary(element_path, child_processors, required, alias)
         if alias:
-            self._alias = alias
+            self._alias = _intern(alias)
         else:
-            self._alias = element_path
+            self._alias = self._element_path
 
     @property
     def alias(self):
@@ -730,6 +774,20 @@ class _Aggregate(RootProcessor):
 class _Array(RootProcessor):
     """An XML processor for Array values."""
 
+    __slots__ = (
+        '_alias',
+        '_element_names',
+        '_element_path',
+        '_item_path',
+        '_item_processor',
+        '_item_text_parser',
+        '_nested',
+        '_required',
+        '_root_path',
+        '_streamable',
+        'omit_empty',
+    )
+
     def __init__(
             self,
             item_processor,  # type: Processor
@@ -739,13 +797,13 @@ class _Array(RootProcessor):
     ):
         # type: (...) -> None
         self._item_processor = item_processor
-        self._nested = nested
+        self._nested = _intern(nested) if nested else nested
         self._required = item_processor.required
 
         if alias:
-            self._alias = alias
-        elif nested:
-            self._alias = nested
+            self._alias = _intern(alias)
+        elif self._nested:
+            self._alias = self._nested
         else:
             self._alias = item_processor.alias
 
@@ -754,8 +812,25 @@ class _Array(RootProcessor):
         else:
             self._element_path = '.'  # Array is embedded directly on parent
 
+        self._root_path = _element_path_split_root(self._element_path)
+        self._element_names = _element_path_names(self._element_path)
+
         self._item_path = self.element_path + '/' + self._item_processor.element_path
 
+        if isinstance(item_processor, _PrimitiveValue):
+            self._item_text_parser = item_processor.text_parser
+        else:
+            self._item_text_parser = None
+
+        # When the items of a root array are direct children of the root element, each item
+        # can be parsed as soon as it has been read rather than after the whole document has
+        # been loaded.
+        self._streamable = (
+            nested is not None and
+            _is_simple_tag(nested) and
+            _is_simple_tag(item_processor.element_path)
+        )
+
         if not nested or self.required:
             self.omit_empty = False
             if omit_empty:
@@ -781,6 +856,12 @@ class _Array(RootProcessor):
         """Get whether the processor's value is required."""
         return self._required
 
+    @property
+    def streamable(self):
+        # type: (...) -> bool
+        """Get whether the array can be parsed from a stream as the root of a document."""
+        return self._streamable
+
     def parse_at_element(
             self,
             element,  # type: ET.Element
@@ -788,7 +869,7 @@ class _Array(RootProcessor):
     ):
         # type: (...) -> Any
         """Parse the provided element as an array."""
-        item_iter = element.findall(self._item_processor.element_path)
+        item_iter = element.iterfind(self._item_processor.element_path)
         return self._parse(item_iter, state)
 
     def parse_at_root(
@@ -804,7 +885,7 @@ class _Array(RootProcessor):
 
         parsed_array = []  # type: List
 
-        array_element = _element_find_from_root(root, self._nested)
+        array_element = _element_find_from_root(root, self._root_path)
         if array_element is not None:
             parsed_array = self.parse_at_element(array_element, state)
         elif self.required:
@@ -819,9 +900,65 @@ class _Array(RootProcessor):
     ):
         # type: (...) -> Any
         """Parse the array data from the provided parent XML element."""
-        item_iter = parent.findall(self._item_path)
+        item_iter = parent.iterfind(self._item_path)
         return self._parse(item_iter, state)
 
+    def parse_from_stream(
+            self,
+            chunks,  # type: Iterable[Union[Text, bytes]]
+            state  # type: _ProcessorState
+    ):
+        # type: (...) -> Any
+        """
+        Parse the array as the root of the XML document provided as an iterable of text chunks.
+
+        Each item is parsed and then discarded as soon as its element has been read so that the
+        element tree for the full document is never held in memory. Only valid for streamable
+        arrays.
+        """
+        parsed_array = []  # type: List
+        item_processor = self._item_processor
+        item_path = item_processor.element_path
+        item_text_parser = self._item_text_parser
+        local_tags = {}  # type: Dict[Text, Text]
+
+        def _parse_root_child(root, child):
+            root.remove(child)
+
+            # As when parsing a complete element tree, namespaces are stripped from the document
+            # only if the root element has one.
+            if '}' in root.tag:
+                _xml_namespace_strip_tags(child, local_tags)
+
+            if _tag_local_name(root.tag) != self._nested or child.tag != item_path:
+                return
+
+            if item_text_parser is not None:
+                try:
+                    parsed_array.append(item_text_parser(child.text, state))
+                    return
+                except InvalidPrimitiveValue:
+                    # Parse the item again below so that the error reports its location.
+                    pass
+
+            state.push_location(item_path, len(parsed_array))
+            parsed_array.append(item_processor.parse_at_element(child, state))
+            state.pop_location()
+
+        parser = ET.XMLParser(target=_RootChildStreamTarget(_parse_root_child))
+        for chunk in chunks:
+            parser.feed(_parseable_text(chunk))
+
+        root = parser.close()
+
+        if _tag_local_name(root.tag) != self._nested and self.required:
+            raise MissingValue('Missing required array at root: "{}"'.format(self._nested))
+
+        if not parsed_array and self.required:
+            state.raise_error(MissingValue, 'Missing required array "{}"'.format(self.alias))
+
+        return parsed_array
+
     def serialize(
             self,
             value,  # type: Any
@@ -838,7 +975,7 @@ class _Array(RootProcessor):
             state.raise_error(MissingValue, 'Missing required array: "{}"'.format(
                 self.alias))
 
-        start_element, end_element = _element_path_create_new(self._nested)
+        start_element, end_element = _element_path_create_new(self._element_names)
         self._serialize(end_element, value, state)
 
         return start_element
@@ -859,7 +996,7 @@ class _Array(RootProcessor):
             return  # Do nothing
 
         if self._nested is not None:
-            array_parent = _element_get_or_add_from_parent(parent, self._nested)
+            array_parent = _element_get_or_add_from_parent(parent, self._element_names)
         else:
             # Embedded array has all items serialized directly on the parent.
             array_parent = parent
@@ -873,18 +1010,44 @@ class _Array(RootProcessor):
     ):
         # type: (...) -> List
         """Parse the array data using the provided iterator of XML elements."""
-        parsed_array = []
-
-        for i, item in enumerate(item_iter):
-            state.push_location(self._item_processor.element_path, i)
-            parsed_array.append(self._item_processor.parse_at_element(item, state))
-            state.pop_location()
+        item_text_parser = self._item_text_parser
+        if item_text_parser is None:
+            parsed_array = self._parse_items(item_iter, state)
+        else:
+            items = list(item_iter)
+            try:
+                parsed_array = [item_text_parser(item.text, state) for item in items]
+            except InvalidPrimitiveValue:
+                # Parse the items again one at a time so that the error reports the location
+                # of the invalid item.
+                parsed_array = self._parse_items(items, state)
 
         if not parsed_array and self.required:
             state.raise_error(MissingValue, 'Missing required array "{}"'.format(self.alias))
 
         return parsed_array
 
+    def _parse_items(
+            self,
+            item_iter,  # type: Iterable[ET.Element]
+            state  # type: _ProcessorState
+    ):
+        # type: (...) -> List
+        """Parse each item in the provided iterator of XML elements with the item processor."""
+        parsed_array = []  # type: List
+        append = parsed_array.append
+
+        item_processor = self._item_processor
+        item_path = item_processor.element_path
+        push_location = state.push_location
+        pop_location = state.pop_location
+        for i, item in enumerate(item_iter):
+            push_location(item_path, i)
+            append(item_processor.parse_at_element(item, state))
+            pop_location()
+
+        return parsed_array
+
     def _serialize(
             self,
             array_parent,  # type: ET.Element
@@ -908,6 +1071,15 @@ class _Array(RootProcessor):
 class _Dictionary(RootProcessor):
     """An XML processor for dictionary values."""
 
+    __slots__ = (
+        '_alias',
+        '_children',
+        '_element_names',
+        '_element_path',
+        '_required',
+        '_root_path',
+    )
+
     def __init__(
             self,
             element_path,  # type: Text
@@ -916,13 +1088,25 @@ class _Dictionary(RootProcessor):
             alias=None  # type: Optional[Text]
     ):
         # type: (...) -> None
-        self._element_path = element_path
-        self._child_processors = child_processors
+        self._element_path = _intern(element_path)
+        self._root_path = _element_path_split_root(self._element_path)
+        self._element_names = _element_path_names(self._element_path)
+
+        # Prepare the alias and location of each child up front so they do not need to be
+        # recomputed for every element that is processed.
+        self._children = tuple(
+            (
+                child.alias,
+                ProcessorLocation(element_path=child.element_path, array_index=None),
+                child,
+            )
+            for child in child_processors
+        )  # type: Tuple[Tuple[Text, ProcessorLocation, Processor], ...]
         self._required = required
         if alias:
-            self._alias = alias
+            self._alias = _intern(alias)
         else:
-            self._alias = element_path
+            self._alias = self._element_path
 
     @property
     def alias(self):
@@ -951,10 +1135,14 @@ class _Dictionary(RootProcessor):
         """Parse the provided element as a dictionary."""
         parsed_dict = {}
 
-        for child in self._child_processors:
-            state.push_location(child.element_path)
-            parsed_dict[child.alias] = child.parse_from_parent(element, state)
-            state.pop_location()
+        # Bind the state methods once since this loop runs for every child of every dictionary
+        # in the document.
+        push_location = state.push_location_entry
+        pop_location = state.pop_location
+        for alias, location, child in self._children:
+            push_location(location)
+            parsed_dict[alias] = child.parse_from_parent(element, state)
+            pop_location()
 
         return parsed_dict
 
@@ -967,7 +1155,7 @@ class _Dictionary(RootProcessor):
         """Parse the root XML element as a dictionary."""
         parsed_dict = {}  # type: Dict
 
-        dict_element = _element_find_from_root(root, self.element_path)
+        dict_element = _element_find_from_root(root, self._root_path)
         if dict_element is not None:
             parsed_dict = self.parse_at_element(dict_element, state)
         elif self.required:
@@ -982,14 +1170,14 @@ class _Dictionary(RootProcessor):
     ):
         # type: (...) -> Any
         """Parse the dictionary data from the provided parent XML element."""
-        element = parent.find(self.element_path)
+        element = parent.find(self._element_path)
+        if element is not None:
+            return self.parse_at_element(element, state)
 
-        if element is None and self.required:
+        if self._required:
             state.raise_error(
-                MissingValue, 'Missing required aggregate "{}"'.format(self.element_path)
+                MissingValue, 'Missing required aggregate "{}"'.format(self._element_path)
             )
-        elif element is not None:
-            return self.parse_at_element(element, state)
 
         return {}
 
@@ -1005,7 +1193,7 @@ class _Dictionary(RootProcessor):
                 MissingValue, 'Missing required aggregate "{}"'.format(self.element_path)
             )
 
-        start_element, end_element = _element_path_create_new(self.element_path)
+        start_element, end_element = _element_path_create_new(self._element_names)
         self._serialize(end_element, value, state)
         return start_element
 
@@ -1024,7 +1212,7 @@ class _Dictionary(RootProcessor):
         if not value:
             return  # Do Nothing
 
-        element = _element_get_or_add_from_parent(parent, self.element_path)
+        element = _element_get_or_add_from_parent(parent, self._element_names)
         self._serialize(element, value, state)
 
     def _serialize(
@@ -1035,16 +1223,26 @@ class _Dictionary(RootProcessor):
     ):
         # type: (...) -> None
         """Serialize the dictionary and append all serialized children to the element."""
-        for child in self._child_processors:
-            state.push_location(child.element_path)
-            child_value = value.get(child.alias)
-            child.serialize_on_parent(element, child_value, state)
-            state.pop_location()
+        get_child_value = value.get
+        push_location = state.push_location_entry
+        pop_location = state.pop_location
+        for alias, location, child in self._children:
+            push_location(location)
+            child.serialize_on_parent(element, get_child_value(alias), state)
+            pop_location()
 
 
 class _HookedAggregate(RootProcessor):
     """A processor which decorates a processor and applies hooks to all values processed."""
 
+    __slots__ = (
+        '_alias',
+        '_element_path',
+        '_hooks',
+        '_processor',
+        '_required',
+    )
+
     def __init__(
             self,
             processor,  # type: RootProcessor
@@ -1130,10 +1328,23 @@ class _HookedAggregate(RootProcessor):
 class _PrimitiveValue(Processor):
     """An XML processor for processing primitive values."""
 
+    __slots__ = (
+        '_alias',
+        '_attribute',
+        '_default',
+        '_element_names',
+        '_element_path',
+        '_hooks',
+        '_parser_func',
+        '_required',
+        'omit_empty',
+        'text_parser',
+    )
+
     def __init__(
             self,
             element_path,  # type: Text
-            parser_func,  # type: Callable[[Optional[Text], _ProcessorState], Any]
+            parser_func,  # type: _TextParser
             attribute=None,  # type: Optional[Text]
             required=True,  # type: bool
             alias=None,  # type: Optional[Text]
@@ -1155,19 +1366,27 @@ class _PrimitiveValue(Processor):
             required is False.
         :param hooks: A Hooks object.
         """
-        self._element_path = element_path
+        self._element_path = _intern(element_path)
+        self._element_names = _element_path_names(self._element_path)
         self._parser_func = parser_func
-        self._attribute = attribute
+        self._attribute = _intern(attribute) if attribute else attribute
         self._required = required
         self._default = default
         self._hooks = hooks
 
+        # Values held in the text of their element with no hooks to apply are parsed from the
+        # text alone, which lets arrays of such values parse all of their items in bulk.
+        if not attribute and hooks is None:
+            self.text_parser = parser_func  # type: Optional[_TextParser]
+        else:
+            self.text_parser = None
+
         if alias:
-            self._alias = alias
-        elif attribute:
-            self._alias = attribute
+            self._alias = _intern(alias)
+        elif self._attribute:
+            self._alias = self._attribute
         else:
-            self._alias = element_path
+            self._alias = self._element_path
 
         # If a value is required, then it will never be omitted when serialized. This
         # is to ensure that data that is serialized by a processor can also be parsed
@@ -1211,6 +1430,10 @@ class _PrimitiveValue(Processor):
         else:
             parsed_value = self._parser_func(element.text, state)
 
+        # Most primitives have no hooks, so skip applying them entirely in that case.
+        if self._hooks is None:
+            return parsed_value
+
         return _hooks_apply_after_parse(self._hooks, state, parsed_value)
 
     def parse_from_parent(
@@ -1220,14 +1443,18 @@ class _PrimitiveValue(Processor):
     ):
         # type: (...) -> Any
         """Parse the primitive value under the parent XML element."""
-        element = parent.find(self.element_path)
+        if self._element_path == '.':
+            # Values on the parent itself, typically attributes, do not need to be found.
+            return self.parse_at_element(parent, state)
+
+        element = parent.find(self._element_path)
+        if element is not None:
+            return self.parse_at_element(element, state)
 
-        if element is None and self.required:
+        if self._required:
             state.raise_error(
-                MissingValue, 'Missing required element "{}"'.format(self.element_path)
+                MissingValue, 'Missing required element "{}"'.format(self._element_path)
             )
-        elif element is not None:
-            return self.parse_at_element(element, state)
 
         return _hooks_apply_after_parse(self._hooks, state, self._default)
 
@@ -1244,7 +1471,7 @@ class _PrimitiveValue(Processor):
         """
         # For primitive values, this is only called when the value is part of an array,
         # in which case we do not need to check for missing or omitted values.
-        start_element, end_element = _element_path_create_new(self.element_path)
+        start_element, end_element = _element_path_create_new(self._element_names)
         self._serialize(end_element, value, state)
         return start_element
 
@@ -1263,7 +1490,7 @@ class _PrimitiveValue(Processor):
         if not value and self.omit_empty:
             return  # Do Nothing
 
-        element = _element_get_or_add_from_parent(parent, self.element_path)
+        element = _element_get_or_add_from_parent(parent, self._element_names)
         self._serialize(element, value, state)
 
     def _missing_value_message(self, parent):
@@ -1295,7 +1522,7 @@ class _PrimitiveValue(Processor):
 
         if attribute_value is not None:
             parsed_value = self._parser_func(attribute_value, state)
-        elif self.required:
+        elif self._required:
             state.raise_error(
                 MissingValue, 'Missing required attribute "{}" on element "{}"'.format(
                     self._attribute, element.tag
@@ -1312,7 +1539,9 @@ class _PrimitiveValue(Processor):
     ):
         # type: (...) -> None
         """Serialize the value to the element."""
-        xml_value = _hooks_apply_before_serialize(self._hooks, state, value)
+        xml_value = value
+        if self._hooks is not None:
+            xml_value = _hooks_apply_before_serialize(self._hooks, state, value)
 
         # A value is only considered missing, and hence eligible to be replaced by its
         # default only if it is None. Falsey values are not considered missing and are
@@ -1334,6 +1563,8 @@ class _PrimitiveValue(Processor):
 class _ProcessorState(object):
     """Keeps track of the state of the processor in order to provide useful error messages."""
 
+    __slots__ = ('_locations',)
+
     def __init__(self):
         self._locations = []  # type: List[ProcessorLocation]
 
@@ -1358,6 +1589,11 @@ class _ProcessorState(object):
         location = ProcessorLocation(element_path=element_path, array_index=array_index)
         self._locations.append(location)
 
+    def push_location_entry(self, location):
+        # type: (ProcessorLocation) -> None
+        """Push an already created location onto the state's stack of locations."""
+        self._locations.append(location)
+
     def raise_error(
             self,
             exception_type,  # type: Type[Exception]
@@ -1387,6 +1623,74 @@ class _ProcessorState(object):
         return location_str
 
 
+class _RootChildStreamTarget(object):
+    """
+    XML parser target which builds an element tree and reports each child of the root element.
+
+    The callback is invoked with the root element and the child element as soon as the child
+    element has been completely read.
+    """
+
+    def __init__(
+            self,
+            on_root_child  # type: Callable[[ET.Element, ET.Element], None]
+    ):
+        # type: (...) -> None
+        self._builder = builder = ET.TreeBuilder()
+        self._on_root_child = on_root_child
+        self._root = None  # type: Optional[ET.Element]
+        self._depth = 0
+
+        # The parser calls the target for every piece of text in the document, so hand text
+        # straight to the tree builder rather than through a method of this target.
+        self.data = builder.data
+
+    def close(self):
+        # type: () -> ET.Element
+        """Finish building the tree and return its root element."""
+        return self._builder.close()
+
+    def end(self, tag):
+        # type: (Text) -> ET.Element
+        """Close the current element."""
+        element = self._builder.end(tag)
+        self._depth -= 1
+        if self._depth == 1:
+            assert self._root is not None
+            self._on_root_child(self._root, element)
+
+        return element
+
+    def start(self, tag, attrs):
+        # type: (Text, Dict[Text, Text]) -> ET.Element
+        """Open a new element."""
+        element = self._builder.start(tag, attrs)
+        if self._root is None:
+            self._root = element
+
+        self._depth += 1
+        return element
+
+
+def _constructor_takes_no_arguments(cls):
+    # type: (Type[Any]) -> bool
+    """Return whether objects of the class are always constructed without any arguments."""
+    init = getattr(cls, '__init__', None)
+    if init is object.__init__:
+        return getattr(cls, '__new__', None) is object.__new__
+
+    code = getattr(getattr(init, '__func__', init), '__code__', None)
+    if code is None:
+        return False
+
+    variable_arguments = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS  # pylint: disable=no-member
+    return (
+        code.co_argcount == 1 and
+        not getattr(code, 'co_kwonlyargcount', 0) and
+        not code.co_flags & variable_arguments
+    )
+
+
 def _element_append_path(
         start_element,  # type: ET.Element
         element_names  # type: Iterable[Text]
@@ -1408,21 +1712,21 @@ def _element_append_path(
 
 def _element_find_from_root(
         root,  # type: ET.Element
-        element_path  # type: Text
+        root_path  # type: _RootPath
 ):
     # type: (...) -> Optional[ET.Element]
     """
     Find the element specified by the given path starting from the root element of the document.
 
-    The first component of the element path is expected to be the name of the root element. Return
-    None if the element is not found.
+    The root path should be created by _element_path_split_root. Return None if the element is
+    not found.
     """
     element = None
 
-    element_names = element_path.split('/')
-    if element_names[0] == root.tag:
-        if len(element_names) > 1:
-            element = root.find('/'.join(element_names[1:]))
+    root_name, relative_path = root_path
+    if root_name == root.tag:
+        if relative_path:
+            element = root.find(relative_path)
         else:
             element = root
 
@@ -1431,17 +1735,15 @@ def _element_find_from_root(
 
 def _element_get_or_add_from_parent(
         parent,  # type: ET.Element
-        element_path  # type: Text
+        element_names  # type: _ElementNames
 ):
     # type: (...) -> ET.Element
     """
-    Ensure all elements specified in the given path relative to the provided parent element exist.
+    Ensure all elements along the given path relative to the provided parent element exist.
 
-    Create new elements along the path only when needed, and return the final element specified
-    by the path.
+    The element names should be created by _element_path_names. Create new elements along the
+    path only when needed, and return the final element specified by the path.
     """
-    element_names = element_path.split('/')
-
     # Starting from the parent, walk the element path until we find the first element in the path
     # that does not exist. Create that element and all the elements following it in the path. If
     # all elements along the path exist, then we will simply walk the full path to the final
@@ -1460,22 +1762,47 @@ def _element_get_or_add_from_parent(
     return existing_element
 
 
-def _element_path_create_new(element_path):
-    # type: (Text) -> Tuple[ET.Element, ET.Element]
+def _element_path_create_new(element_names):
+    # type: (_ElementNames) -> Tuple[ET.Element, ET.Element]
     """
     Create an entirely new element path.
 
-    Return a tuple where the first item is the first element in the path, and the second item is
-    the final element in the path.
+    The element names should be created by _element_path_names. Return a tuple where the first
+    item is the first element in the path, and the second item is the final element in the path.
     """
-    element_names = element_path.split('/')
-
     start_element = ET.Element(element_names[0])
     end_element = _element_append_path(start_element, element_names[1:])
 
     return start_element, end_element
 
 
+def _element_path_names(element_path):
+    # type: (Text) -> _ElementNames
+    """
+    Split the element path into the names of the elements along it.
+
+    Processors split their paths once when they are created rather than every time a value is
+    serialized. The names are interned since they become the tags of the serialized elements.
+    """
+    return tuple(_intern(element_name) for element_name in element_path.split('/'))
+
+
+def _element_path_split_root(element_path):
+    # type: (Text) -> _RootPath
+    """
+    Split the element path into the name of the root element and the path relative to the root.
+
+    The relative path is None if the element path refers to the root element itself.
+    """
+    element_names = element_path.split('/')
+
+    relative_path = None
+    if len(element_names) > 1:
+        relative_path = '/'.join(element_names[1:])
+
+    return element_names[0], relative_path
+
+
 def _hooks_apply_after_parse(
         hooks,  # type: Optional[Hooks]
         state,  # type: _ProcessorState
@@ -1502,6 +1829,24 @@ def _hooks_apply_before_serialize(
     return value
 
 
+def _intern(text):
+    # type: (Text) -> Text
+    """Intern the text so that equal names used by processors share a single string object."""
+    # Python 2 can only intern byte strings, and processor names are frequently unicode. Only
+    # exact strings can be interned, so subclasses such as string enum members are left as is
+    # to be handed back unchanged as the keys of parsed values.
+    exact_str = type(text) is str  # pylint: disable=unidiomatic-typecheck
+    return sys.intern(text) if not _PY2 and exact_str else text
+
+
+def _is_simple_tag(element_path):
+    # type: (Text) -> bool
+    """Return True if the element path is a single element name with no XPath syntax."""
+    return bool(element_path) and not any(
+        character in _PATH_SPECIAL_CHARACTERS for character in element_path
+    )
+
+
 def _is_valid_root_processor(processor):
     # type: (Processor) -> bool
     """Return True if the given XML processor can be used as a root processor."""
@@ -1529,8 +1874,10 @@ def _named_tuple_converter(tuple_type):
 
 
 def _number_parser(str_to_number_func):
+    # type: (Callable[[Any], Any]) -> _TextParser
     """Return a function to parse numbers."""
     def _parse_number_value(element_text, state):
+        # type: (Optional[Text], _ProcessorState) -> Any
         value = None
 
         try:
@@ -1544,21 +1891,88 @@ def _number_parser(str_to_number_func):
     return _parse_number_value
 
 
+# Number parsers are shared by all numeric processors rather than created for each processor.
+_parse_float = _number_parser(float)
+_parse_integer = _number_parser(int)
+
+
 def _parse_boolean(element_text, state):
+    # type: (Optional[Text], _ProcessorState) -> bool
     """Parse the raw XML string as a boolean value."""
-    value = None
-
-    lowered_text = element_text.lower()
-    if lowered_text == 'true':
-        value = True
-    elif lowered_text == 'false':
-        value = False
-    else:
+    value = None  # type: Optional[bool]
+    if element_text is not None:
+        value = _BOOLEAN_VALUES.get(element_text)
+        if value is None:
+            # Boolean values are case-insensitive, so fall back to lowering only for mixed-case
+            # text that is not already in the lookup table.
+            value = _BOOLEAN_VALUES.get(element_text.lower())
+
+    if value is None:
         state.raise_error(InvalidPrimitiveValue, 'Invalid boolean value "{}"'.format(element_text))
 
     return value
 
 
+def _parse_chunks(
+        root_processor,  # type: RootProcessor
+        chunks  # type: Iterable[Union[Text, bytes]]
+):
+    # type: (...) -> Any
+    """Parse the value from an XML document provided as an iterable of text chunks."""
+    if isinstance(root_processor, _Array) and root_processor.streamable:
+        state = _ProcessorState()
+        state.push_location(root_processor.element_path)
+        return root_processor.parse_from_stream(chunks, state)
+
+    parser = ET.XMLParser()
+    for chunk in chunks:
+        parser.feed(_parseable_text(chunk))
+
+    root = parser.close()
+
+    return _parse_root(root_processor, root)
+
+
+def _parse_root(
+        root_processor,  # type: RootProcessor
+        root  # type: ET.Element
+):
+    # type: (...) -> Any
+    """Parse the value from the root element of a parsed XML document."""
+    _xml_namespace_strip(root)
+
+    state = _ProcessorState()
+    state.push_location(root_processor.element_path)
+    return root_processor.parse_at_root(root, state)
+
+
+def _parse_string(element_text, _state):
+    # type: (Optional[Text], _ProcessorState) -> Text
+    """Parse the raw XML string as a string value, leaving whitespace in place."""
+    if element_text is None:
+        return ''
+
+    return element_text
+
+
+def _parse_string_stripped(element_text, _state):
+    # type: (Optional[Text], _ProcessorState) -> Text
+    """Parse the raw XML string as a string value with surrounding whitespace stripped."""
+    if element_text is None:
+        return ''
+
+    return element_text.strip()
+
+
+def _parseable_text(xml_text):
+    # type: (Union[Text, bytes]) -> Union[Text, bytes]
+    """Return the XML text in a form that can be fed to the XML parser."""
+    if _PY2 and isinstance(xml_text, Text):
+        return xml_text.encode('utf-8')
+
+    return xml_text
+
+
 def _processor_wrap_if_hooks(
         processor,  # type: RootProcessor
         hooks  # type: Optional[Hooks]
@@ -1572,32 +1986,41 @@ def _processor_wrap_if_hooks(
 
 
 def _string_parser(strip_whitespace):
+    # type: (bool) -> _TextParser
     """Return a parser function for parsing string values."""
-    def _parse_string_value(element_text, _state):
-        if element_text is None:
-            value = ''
-        elif strip_whitespace:
-            value = element_text.strip()
-        else:
-            value = element_text
+    # Choose the parser once when the processor is created rather than checking the
+    # strip_whitespace option for every value parsed.
+    if strip_whitespace:
+        return _parse_string_stripped
+
+    return _parse_string
 
-        return value
 
-    return _parse_string_value
+def _tag_local_name(tag):
+    # type: (Text) -> Text
+    """Return the tag with any XML namespace prefix removed."""
+    return tag.split('}')[-1]
 
 
 def _user_object_converter(cls):
     # type: (Type[Any]) -> _AggregateConverter
     """Return an _AggregateConverter for a user object of the given class."""
+    # Avoid attempting, and failing, to construct every object with keyword arguments when
+    # the constructor cannot accept any.
+    use_keyword_arguments = not _constructor_takes_no_arguments(cls)
+
     def _from_dict(dict_value):
-        try:
-            object_value = cls(**dict_value)
-        except TypeError:
-            # Constructor does not support keyword arguments, try setting each
-            # field individually.
-            object_value = cls()
-            for field_name, field_value in dict_value.items():
-                setattr(object_value, field_name, field_value)
+        if use_keyword_arguments:
+            try:
+                return cls(**dict_value)
+            except TypeError:
+                pass
+
+        # Constructor does not support keyword arguments, try setting each
+        # field individually.
+        object_value = cls()
+        for field_name, field_value in dict_value.items():
+            setattr(object_value, field_name, field_value)
 
         return object_value
 
@@ -1616,10 +2039,23 @@ def _xml_namespace_strip(root):
     if '}' not in root.tag:
         return  # Nothing to do, no namespace present
 
-    for element in root.iter():
-        if '}' in element.tag:
-            element.tag = element.tag.split('}')[1]
-        else:  # pragma: no cover
-            # We should never get here. If there is a namespace, then the namespace should be
-            # included in all elements.
-            pass
+    _xml_namespace_strip_tags(root, {})
+
+
+def _xml_namespace_strip_tags(
+        start_element,  # type: ET.Element
+        local_tags  # type: Dict[Text, Text]
+):
+    # type: (...) -> None
+    """
+    Strip the XML namespace prefix from the tags of the start element and all elements under it.
+
+    Documents use only a handful of distinct tags, so each tag is stripped once and the result is
+    kept in local_tags to be reused for every element that shares the tag.
+    """
+    for element in start_element.iter():
+        tag = element.tag
+        local_tag = local_tags.get(tag)
+        if local_tag is None:
+            local_tag = local_tags[tag] = _tag_local_name(tag)
+        element.tag = local_tag
@@ -4,6 +4,9 @@ import re
 import declxml as xml
 
 
+_WHITESPACE_BETWEEN_TAGS = re.compile(r'>\s+<')
+
+
 def assert_can_roundtrip_xml_value(processor, value):
     """Assert that a value can be converted to and from XML."""
     xml_string = xml.serialize_to_string(processor, value)
@@ -12,10 +15,19 @@ def assert_can_roundtrip_xml_value(processor, value):
     assert value == actual_value
 
 
+def assert_parses_and_serializes(processor, value, xml_string):
+    """Assert that the XML string parses to the value and that the value serializes to it."""
+    actual_value = xml.parse_from_string(processor, xml_string)
+    assert value == actual_value
+
+    actual_xml_string = xml.serialize_to_string(processor, value)
+    assert xml_string == actual_xml_string
+
+
 def strip_xml(xml_string):
     """Prepares the XML string so it can be compared to the actual serialized output"""
     # Strip internal whitespace between tags
-    stripped = re.sub(r'>\s+<', '><', xml_string)
+    stripped = _WHITESPACE_BETWEEN_TAGS.sub('><', xml_string)
 
     # Strip external whitespace
     return stripped.strip()
@@ -199,6 +199,30 @@ def test_user_object_parse_array():
     assert expected == actual
 
 
+def test_user_object_parse_keyword_constructor():
+    """Parse a user object whose class is constructed with keyword arguments"""
+    class _Point(dict):
+        pass
+
+    xml_string = """
+    <point>
+        <x>3</x>
+        <y>4</y>
+    </point>
+    """
+
+    processor = xml.user_object('point', _Point, [
+        xml.integer('x'),
+        xml.integer('y')
+    ])
+
+    expected = _Point(x=3, y=4)
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert expected == actual
+
+
 def test_user_object_parse_nested():
     """Parse a user object as a nested element in the document"""
     xml_string = """
@@ -230,6 +254,50 @@ def test_user_object_parse_nested():
     assert expected == actual
 
 
+def test_user_object_parse_no_constructor():
+    """Parse a user object whose class does not define a constructor"""
+    class _Pet(object):
+        pass
+
+    xml_string = """
+    <pet>
+        <name>Fido</name>
+        <kind>dog</kind>
+    </pet>
+    """
+
+    processor = xml.user_object('pet', _Pet, [
+        xml.string('name'),
+        xml.string('kind')
+    ])
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert isinstance(actual, _Pet)
+    assert ('Fido', 'dog') == (actual.name, actual.kind)
+
+
+def test_user_object_parse_positional_constructor():
+    """Parse a user object whose constructor does not accept keyword arguments"""
+    class _Pet(object):
+        def __init__(self, *args):
+            self.args = args
+
+    xml_string = """
+    <pet>
+        <name>Fido</name>
+    </pet>
+    """
+
+    processor = xml.user_object('pet', _Pet, [
+        xml.string('name')
+    ])
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert ((), 'Fido') == (actual.args, actual.name)
+
+
 def test_user_object_parse_root():
     """Parse a user object as the root of the document"""
     xml_string = """
@@ -4,7 +4,7 @@ from collections import namedtuple
 import pytest
 
 import declxml as xml
-from .helpers import strip_xml
+from .helpers import assert_parses_and_serializes, strip_xml
 
 
 _UserTuple = namedtuple('_UserTuple', [
@@ -599,8 +599,4 @@ def _assert_invalid(processor, value, xml_string):
 
 def _assert_valid(processor, value, xml_string):
     """Assert the processor accepts the XML and value as valid."""
-    actual_value = xml.parse_from_string(processor, xml_string)
-    assert value == actual_value
-
-    actual_xml_string = xml.serialize_to_string(processor, value)
-    assert xml_string == actual_xml_string
+    assert_parses_and_serializes(processor, value, xml_string)
@@ -3,7 +3,21 @@ from collections import OrderedDict, namedtuple
 
 
 import declxml as xml
-from .helpers import strip_xml
+from .helpers import assert_parses_and_serializes, strip_xml
+
+
+def _integer_double(_, value):
+    """Double the integer value"""
+    return int(value * 2)
+
+
+def _integer_halve(_, value):
+    """Halve the integer value"""
+    return int(value / 2)
+
+
+# Hooks for integers whose parsed values are double the values stored in the XML
+_INTEGER_DOUBLING_HOOKS = xml.Hooks(after_parse=_integer_double, before_serialize=_integer_halve)
 
 
 class TestArrayValueTransform(object):
@@ -11,16 +25,22 @@ class TestArrayValueTransform(object):
 
     @staticmethod
     def _after_parse(_, array_value):
-        dict_value = OrderedDict()
-        for item in array_value:
-            dict_value[item['key']] = item['value']
-
-        return dict_value
+        return OrderedDict((item['key'], item['value']) for item in array_value)
 
     @staticmethod
     def _before_serialize(_, dict_value):
         return [{'key': k, 'value': v} for k, v in dict_value.items()]
 
+    _item_processor = xml.dictionary('value', [
+        xml.string('.', attribute='key'),
+        xml.integer('.', alias='value')
+    ])
+
+    _hooks = xml.Hooks(
+        after_parse=_after_parse.__func__,
+        before_serialize=_before_serialize.__func__
+    )
+
     def test_array_of_arrays(self):
         """Transform array values for a nested array"""
         xml_string = strip_xml("""
@@ -62,7 +82,7 @@ class TestArrayValueTransform(object):
             )
         ])
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_non_root_array(self):
         """Transform array values for non-root arrays"""
@@ -89,7 +109,7 @@ class TestArrayValueTransform(object):
             xml.array(self._item_processor, alias='values', hooks=self._hooks)
         ])
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_root_array(self):
         """Transform array values for root arrays"""
@@ -109,21 +129,7 @@ class TestArrayValueTransform(object):
 
         processor = xml.array(self._item_processor, nested='data', hooks=self._hooks)
 
-        _transform_test_case_run(processor, value, xml_string)
-
-    @property
-    def _item_processor(self):
-        return xml.dictionary('value', [
-                xml.string('.', attribute='key'),
-                xml.integer('.', alias='value')
-            ])
-
-    @property
-    def _hooks(self):
-        return xml.Hooks(
-            after_parse=self._after_parse,
-            before_serialize=self._before_serialize
-        )
+        assert_parses_and_serializes(processor, value, xml_string)
 
 
 class TestDictionaryValueTransform(object):
@@ -131,19 +137,20 @@ class TestDictionaryValueTransform(object):
 
     @staticmethod
     def _after_parse(_, dict_value):
-        list_value = []
-        for key, value in dict_value.items():
-            list_value.append((key, value))
-
-        return sorted(list_value)
+        return sorted(dict_value.items())
 
     @staticmethod
     def _before_serialize(_, list_value):
-        dict_value = {}
-        for key, value in list_value:
-            dict_value[key] = value
+        return dict(list_value)
 
-        return dict_value
+    _dict_processor = xml.dictionary('data', [
+        xml.integer('a'),
+        xml.integer('b'),
+        xml.integer('c'),
+    ], hooks=xml.Hooks(
+        after_parse=_after_parse.__func__,
+        before_serialize=_before_serialize.__func__
+    ))
 
     def test_array_element_dictionary(self):
         """Apply a transform to a dictionary in an array"""
@@ -177,7 +184,7 @@ class TestDictionaryValueTransform(object):
 
         processor = xml.array(self._dict_processor, nested='results')
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_non_root_dictionary(self):
         """Apply a transform to a non-root dictionary"""
@@ -206,7 +213,7 @@ class TestDictionaryValueTransform(object):
             self._dict_processor,
         ])
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_root_dictionary(self):
         """Apply a transform to a root dictionary"""
@@ -226,20 +233,7 @@ class TestDictionaryValueTransform(object):
 
         processor = self._dict_processor
 
-        _transform_test_case_run(processor, value, xml_string)
-
-    @property
-    def _dict_processor(self):
-        hooks = xml.Hooks(
-            after_parse=self._after_parse,
-            before_serialize=self._before_serialize
-        )
-
-        return xml.dictionary('data', [
-            xml.integer('a'),
-            xml.integer('b'),
-            xml.integer('c'),
-        ], hooks=hooks)
+        assert_parses_and_serializes(processor, value, xml_string)
 
 
 class TestUserObjectValueTransform(object):
@@ -265,6 +259,14 @@ class TestUserObjectValueTransform(object):
         object_value.age = tuple_value[1]
         return object_value
 
+    _user_object_processor = xml.user_object('person', _Person, [
+        xml.string('name'),
+        xml.integer('age'),
+    ], hooks=xml.Hooks(
+        after_parse=_after_parse.__func__,
+        before_serialize=_before_serialize.__func__,
+    ))
+
     def test_array_element_user_object(self):
         """Apply a transform to a user object in an array"""
         xml_string = strip_xml("""
@@ -287,7 +289,7 @@ class TestUserObjectValueTransform(object):
 
         processor = xml.array(self._user_object_processor, nested='people')
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_non_root_user_object(self):
         """Apply a transform to a root user object"""
@@ -308,7 +310,7 @@ class TestUserObjectValueTransform(object):
             self._user_object_processor,
         ])
 
-        _transform_test_case_run(processor, value, xml_string)
+        assert_parses_and_serializes(processor, value, xml_string)
 
     def test_root_user_object(self):
         """Apply a transform to a root user object"""
@@ -323,19 +325,7 @@ class TestUserObjectValueTransform(object):
 
         processor = self._user_object_processor
 
-        _transform_test_case_run(processor, value, xml_string)
-
-    @property
-    def _user_object_processor(self):
-        hooks = xml.Hooks(
-            after_parse=self._after_parse,
-            before_serialize=self._before_serialize,
-        )
-
-        return xml.user_object('person', self._Person, [
-            xml.string('name'),
-            xml.integer('age'),
-        ], hooks=hooks)
+        assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_boolean_transform():
@@ -368,7 +358,7 @@ def test_boolean_transform():
         xml.boolean('value', hooks=hooks)
     ])
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_floating_point_transform():
@@ -395,7 +385,7 @@ def test_floating_point_transform():
         xml.floating_point('value', hooks=hooks)
     ])
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_integer_transform():
@@ -410,19 +400,11 @@ def test_integer_transform():
         'value': 6
     }
 
-    def _after_parse(_, x):
-        return int(x * 2)
-
-    def _before_serialize(_, x):
-        return int(x / 2)
-
-    hooks = xml.Hooks(after_parse=_after_parse, before_serialize=_before_serialize)
-
     processor = xml.dictionary('data', [
-        xml.integer('value', hooks=hooks)
+        xml.integer('value', hooks=_INTEGER_DOUBLING_HOOKS)
     ])
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_named_tuple_transform():
@@ -448,14 +430,14 @@ def test_named_tuple_transform():
         }
 
     def _before_serialize(_, dict_value):
-        return Person(name=dict_value['name'], age=dict_value['age'])
+        return Person(dict_value['name'], dict_value['age'])
 
     processor = xml.named_tuple('person', Person, [
         xml.string('name'),
         xml.integer('age'),
     ], hooks=xml.Hooks(after_parse=_after_parse, before_serialize=_before_serialize))
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_primitive_transform_array_element():
@@ -474,19 +456,11 @@ def test_primitive_transform_array_element():
         32,
     ]
 
-    def _after_parse(_, x):
-        return int(x * 2)
-
-    def _before_serialize(_, x):
-        return int(x / 2)
-
-    hooks = xml.Hooks(after_parse=_after_parse, before_serialize=_before_serialize)
-
     processor = xml.array(
-        xml.integer('value', hooks=hooks),
+        xml.integer('value', hooks=_INTEGER_DOUBLING_HOOKS),
         nested='data')
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_primitive_transform_attribute():
@@ -501,19 +475,11 @@ def test_primitive_transform_attribute():
         'value': 6,
     }
 
-    def _after_parse(_, x):
-        return int(x * 2)
-
-    def _before_serialize(_, x):
-        return int(x / 2)
-
-    hooks = xml.Hooks(after_parse=_after_parse, before_serialize=_before_serialize)
-
     processor = xml.dictionary('data', [
-        xml.integer('element', attribute='value', hooks=hooks)
+        xml.integer('element', attribute='value', hooks=_INTEGER_DOUBLING_HOOKS)
     ])
 
-    _transform_test_case_run(processor, value, xml_string)
+    assert_parses_and_serializes(processor, value, xml_string)
 
 
 def test_string_transform():
@@ -540,13 +506,4 @@ def test_string_transform():
         xml.string('value', hooks=hooks)
     ])
 
-    _transform_test_case_run(processor, value, xml_string)
-
-
-def _transform_test_case_run(processor, value, xml_string):
-    """Runs the given value transform test case"""
-    actual_value = xml.parse_from_string(processor, xml_string)
-    assert value == actual_value
-
-    actual_xml_string = xml.serialize_to_string(processor, value)
-    assert xml_string == actual_xml_string
+    assert_parses_and_serializes(processor, value, xml_string)
@@ -61,6 +61,28 @@ def test_parse_array_embedded_aliased():
     assert expected == actual
 
 
+def test_parse_array_invalid_item():
+    """Parse array with an invalid primitive item"""
+    xml_string = """
+    <root>
+        <values>
+            <value>21</value>
+            <value>hello</value>
+            <value>90</value>
+        </values>
+    </root>
+    """
+
+    processor = xml.dictionary('root', [
+        xml.array(xml.integer('value'), nested='values'),
+    ])
+
+    with pytest.raises(xml.InvalidPrimitiveValue) as exception_info:
+        xml.parse_from_string(processor, xml_string)
+
+    assert str(exception_info.value).endswith('root/values/value[1]')
+
+
 def test_parse_array_missing():
     """Parse missing array"""
     xml_string = """
@@ -296,6 +318,18 @@ def test_parse_array_optional_present():
     assert expected == actual
 
 
+def test_parse_array_root_invalid_item():
+    """Parse an array as the root processor with an invalid item"""
+    xml_string = '<array><value>1</value><value>hello</value></array>'
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    with pytest.raises(xml.InvalidPrimitiveValue) as exception_info:
+        xml.parse_from_string(processor, xml_string)
+
+    assert str(exception_info.value).endswith('array/value[1]')
+
+
 def test_parse_array_root_missing():
     """Parse an array as the root processor"""
     xml_string = """
@@ -499,6 +533,46 @@ def test_parse_attribute_only():
     assert expected == actual
 
 
+def test_parse_boolean_case_insensitive():
+    """Parse boolean values regardless of their case"""
+    xml_string = """
+    <root>
+        <value>true</value>
+        <value>FALSE</value>
+        <value>tRuE</value>
+        <value>fAlSe</value>
+    </root>
+    """
+
+    processor = xml.dictionary('root', [
+        xml.array(xml.boolean('value')),
+    ])
+
+    expected = {
+        'value': [True, False, True, False],
+    }
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert expected == actual
+
+
+def test_parse_boolean_empty():
+    """Parse an empty boolean value"""
+    xml_string = """
+    <root>
+        <value />
+    </root>
+    """
+
+    processor = xml.dictionary('root', [
+        xml.boolean('value'),
+    ])
+
+    with pytest.raises(xml.InvalidPrimitiveValue):
+        xml.parse_from_string(processor, xml_string)
+
+
 def test_parse_boolean_invalid():
     """Parse an invalid boolean value"""
     xml_string = """
@@ -801,6 +875,184 @@ def test_parse_from_file(tmpdir):
     assert expected == actual
 
 
+def test_parse_from_file_large(tmpdir):
+    """Tests parsing an XML file that is read in multiple chunks"""
+    values = list(range(20000))
+    xml_contents = '<root>{}</root>'.format(
+        ''.join('<value>{}</value>'.format(value) for value in values)
+    )
+
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write(xml_contents)
+
+    processor = xml.dictionary('root', [
+        xml.array(xml.integer('value')),
+    ])
+
+    expected = {
+        'value': values,
+    }
+
+    actual = xml.parse_from_file(processor, xml_file.strpath)
+
+    assert expected == actual
+
+
+def test_parse_from_file_primitive_root_parser(tmpdir):
+    """Parse a file with a primitive-valued root element"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<root>15</root>')
+
+    processor = xml.integer('root')
+
+    with pytest.raises(xml.InvalidRootProcessor):
+        xml.parse_from_file(processor, xml_file.strpath)
+
+
+def test_parse_from_file_root_array(tmpdir):
+    """Parse a file with an array as the root processor"""
+    xml_contents = """
+    <array>
+        <value>1</value>
+        <value>2</value>
+        <value>3</value>
+    </array>
+    """
+
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write(xml_contents)
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    expected = [1, 2, 3]
+
+    actual = xml.parse_from_file(processor, xml_file.strpath)
+
+    assert expected == actual
+
+
+def test_parse_from_file_root_array_namespace(tmpdir):
+    """Parse a file with a namespace and an array as the root processor"""
+    xml_contents = """
+    <people xmlns="http://www.w3.org/1999/xhtml">
+        <person>
+            <name>John</name>
+            <age>27</age>
+        </person>
+        <title>Not a person</title>
+        <person>
+            <name>Jane</name>
+            <age>30</age>
+        </person>
+    </people>
+    """
+
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write(xml_contents)
+
+    processor = xml.array(xml.dictionary('person', [
+        xml.string('name'),
+        xml.integer('age'),
+    ]), nested='people')
+
+    expected = [
+        {
+            'name': 'John',
+            'age': 27,
+        },
+        {
+            'name': 'Jane',
+            'age': 30,
+        },
+    ]
+
+    actual = xml.parse_from_file(processor, xml_file.strpath)
+
+    assert expected == actual
+
+
+def test_parse_from_file_root_array_namespaced_item(tmpdir):
+    """Parse a file with a namespaced item in a root array without a namespace"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<array xmlns:n="urn:n"><n:value>1</n:value><value>2</value></array>')
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    actual = xml.parse_from_file(processor, xml_file.strpath)
+
+    assert [2] == actual
+    assert actual == xml.parse_from_string(processor, xml_file.read())
+
+
+def test_parse_from_file_root_array_namespaced_items_only(tmpdir):
+    """Parse a file with only namespaced items in a root array without a namespace"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<array><value xmlns="urn:n">1</value></array>')
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    with pytest.raises(xml.MissingValue):
+        xml.parse_from_file(processor, xml_file.strpath)
+
+
+def test_parse_from_file_root_array_missing(tmpdir):
+    """Parse a file missing a required root array"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<wrong-array><value>1</value></wrong-array>')
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    with pytest.raises(xml.MissingValue):
+        xml.parse_from_file(processor, xml_file.strpath)
+
+
+def test_parse_from_file_root_array_nested_path_missing(tmpdir):
+    """Parse a file missing a required root array whose path is not a single element"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<data><wrong-array><value>1</value></wrong-array></data>')
+
+    processor = xml.array(xml.integer('value'), nested='data/array')
+
+    with pytest.raises(xml.MissingValue):
+        xml.parse_from_file(processor, xml_file.strpath)
+
+
+def test_parse_from_file_root_array_empty(tmpdir):
+    """Parse a file with an empty required root array"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<array />')
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    with pytest.raises(xml.MissingValue):
+        xml.parse_from_file(processor, xml_file.strpath)
+
+
+def test_parse_from_file_root_array_optional_missing(tmpdir):
+    """Parse a file missing an optional root array"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<wrong-array><value>1</value></wrong-array>')
+
+    processor = xml.array(xml.integer('value', required=False), nested='array')
+
+    actual = xml.parse_from_file(processor, xml_file.strpath)
+
+    assert [] == actual
+
+
+def test_parse_from_file_root_array_invalid_item(tmpdir):
+    """Parse a file with an invalid item in a root array"""
+    xml_file = tmpdir.join('data.xml')
+    xml_file.write('<array><value>1</value><value>hello</value></array>')
+
+    processor = xml.array(xml.integer('value'), nested='array')
+
+    with pytest.raises(xml.InvalidPrimitiveValue) as exception_info:
+        xml.parse_from_file(processor, xml_file.strpath)
+
+    assert str(exception_info.value).endswith('array/value[1]')
+
+
 def test_parse_int_invalid():
     """Parse an invalid int value"""
     xml_string = """
@@ -850,6 +1102,34 @@ def test_parse_namespace():
     assert expected == actual
 
 
+def test_parse_namespace_repeated_tags():
+    """Parses an xml document with a namespace and elements that share tags"""
+    xml_string = """
+    <root xmlns="http://www.w3.org/1999/xhtml">
+        <message>Hello</message>
+        <values>
+            <value>1</value>
+            <value>2</value>
+            <value>3</value>
+        </values>
+    </root>
+    """
+
+    processor = xml.dictionary('root', [
+        xml.string('message'),
+        xml.array(xml.integer('value'), nested='values'),
+    ])
+
+    expected = {
+        'message': 'Hello',
+        'values': [1, 2, 3],
+    }
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert expected == actual
+
+
 def test_parse_primitive():
     """Parse primitve XML values"""
     xml_string = """
@@ -1015,6 +1295,27 @@ def test_parse_string_empty_optional():
     assert expected == actual
 
 
+def test_parse_string_empty_leave_whitespace():
+    """Parse an empty string without stripping whitespace"""
+    xml_string = """
+    <root>
+        <value />
+    </root>
+    """
+
+    processor = xml.dictionary('root', [
+        xml.string('value', strip_whitespace=False)
+    ])
+
+    expected = {
+        'value': '',
+    }
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert expected == actual
+
+
 def test_parse_string_leave_whitespace():
     """Parses a string value without stripping whitespace"""
     xml_string = """
@@ -1055,3 +1356,30 @@ def test_parse_string_strip_whitespace():
     actual = xml.parse_from_string(processor, xml_string)
 
     assert expected == actual
+
+
+def test_parse_string_subclass_names():
+    """Parse with processor names that are instances of a string subclass"""
+    class _Name(str):
+        pass
+
+    xml_string = """
+    <root id="3">
+        <name>Hello</name>
+    </root>
+    """
+
+    processor = xml.dictionary(_Name('root'), [
+        xml.string(_Name('name')),
+        xml.integer('.', attribute=_Name('id'), alias=_Name('identifier')),
+    ])
+
+    expected = {
+        'name': 'Hello',
+        'identifier': 3,
+    }
+
+    actual = xml.parse_from_string(processor, xml_string)
+
+    assert expected == actual
+    assert all(isinstance(key, _Name) for key in actual)
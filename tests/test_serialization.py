@@ -8,6 +8,144 @@ import declxml as xml
 from .helpers import strip_xml
 
 
+_ARRAY_OMIT_EMPTY_PROCESSOR = xml.dictionary('root', [
+    xml.string('message'),
+    xml.array(xml.integer('value', required=False), nested='data', omit_empty=True)
+])
+
+
+_ATTRIBUTE_DEFAULT_PROCESSOR = xml.dictionary('root', [
+    xml.integer('data'),
+    xml.string('data', attribute='units', required=False, default='feet')
+])
+
+
+_ATTRIBUTE_OMIT_EMPTY_PROCESSOR = xml.dictionary('root', [
+    xml.integer('data'),
+    xml.string('data', attribute='message', required=False, omit_empty=True)
+])
+
+
+_NESTED_DICTIONARY_PROCESSOR = xml.dictionary('root', [
+    xml.string('name'),
+    xml.dictionary('demographics', [
+        xml.integer('age'),
+        xml.string('gender')
+    ]),
+    xml.dictionary('favorites', [
+        xml.string('food'),
+        xml.string('color')
+    ])
+])
+
+
+# Values that cannot be serialized by their processor, paired with the error expected
+_INVALID_SERIALIZATION_CASES = [
+    pytest.param(
+        xml.dictionary('root', [
+            xml.string('message'),
+            xml.array(xml.integer('value'), alias='data')
+        ]),
+        {
+            'message': 'Hello',
+            'data': []
+        },
+        xml.MissingValue,
+        id='array_missing'
+    ),
+    pytest.param(
+        xml.array(xml.integer('value'), nested='data'),
+        [],
+        xml.MissingValue,
+        id='array_missing_root'
+    ),
+    pytest.param(
+        xml.array(xml.floating_point('constant')),
+        [3.14, 13.7, 6.22],
+        xml.InvalidRootProcessor,
+        id='array_root_not_nested'
+    ),
+    pytest.param(
+        xml.dictionary('root', [
+            xml.integer('data'),
+            xml.string('data', attribute='units')
+        ]),
+        {
+            'data': 123,
+        },
+        xml.MissingValue,
+        id='attribute_missing'
+    ),
+    pytest.param(
+        _NESTED_DICTIONARY_PROCESSOR,
+        {
+            'name': 'John Doe',
+            'demographics': {
+                'age': 27,
+                'gender': 'male',
+            },
+        },
+        xml.MissingValue,
+        id='dictionary_nested_missing'
+    ),
+    pytest.param(
+        xml.dictionary('root', [
+            xml.string('message')
+        ]),
+        {},
+        xml.MissingValue,
+        id='dictionary_root_empty'
+    ),
+    pytest.param(
+        xml.dictionary('root', [
+            xml.string('message'),
+            xml.integer('data')
+        ]),
+        {
+            'data': 1
+        },
+        xml.MissingValue,
+        id='primitive_missing'
+    ),
+    pytest.param(
+        xml.string('message'),
+        'Hello',
+        xml.InvalidRootProcessor,
+        id='primitive_root'
+    ),
+]
+
+
+_PRIMITIVE_DEFAULT_PROCESSOR = xml.dictionary('root', [
+    xml.string('message', required=False, default='Hello, World'),
+])
+
+
+_PRIMITIVE_VALUES_PROCESSOR = xml.dictionary('root', [
+    xml.boolean('boolean'),
+    xml.floating_point('float'),
+    xml.integer('int'),
+    xml.string('string'),
+])
+
+
+_PRIMITIVE_VALUES = {
+    'boolean': True,
+    'float': 3.14,
+    'int': 1,
+    'string': 'Hello, World'
+}
+
+_PRIMITIVE_VALUES_XML_STRING = strip_xml("""
+<root>
+    <boolean>True</boolean>
+    <float>3.14</float>
+    <int>1</int>
+    <string>Hello, World</string>
+</root>
+""")
+
+
 def test_array_serialize_aggregate():
     """Serialize an array of aggregate values"""
     value = {
@@ -127,22 +265,6 @@ def test_array_serialize_array_of_arrays_omit_empty():
     assert expected == actual
 
 
-def test_array_serialize_missing():
-    """Serialize a missing array"""
-    value = {
-        'message': 'Hello',
-        'data': []
-    }
-
-    processor = xml.dictionary('root', [
-        xml.string('message'),
-        xml.array(xml.integer('value'), alias='data')
-    ])
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_array_serialize_missing_optional():
     """Serialize a missing array"""
     value = {
@@ -196,10 +318,7 @@ def test_array_serialize_omit_empty():
         'data': [],
     }
 
-    processor = xml.dictionary('root', [
-        xml.string('message'),
-        xml.array(xml.integer('value', required=False), nested='data', omit_empty=True)
-    ])
+    processor = _ARRAY_OMIT_EMPTY_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -214,22 +333,20 @@ def test_array_serialize_omit_empty():
 
 def test_array_serialize_omit_empty_non_nested():
     """Seralizes an array with the omit_empty option"""
+    item_processor = xml.integer('value', required=False)
+
     with pytest.warns(UserWarning):
         # Should get a warning when specifying omit_empty for non-nested arrays
-        xml.dictionary('root', [
-            xml.string('message'),
-            xml.array(xml.integer('value', required=False), omit_empty=True)
-        ])
+        xml.array(item_processor, omit_empty=True)
 
 
 def test_array_serialize_omit_empty_required():
     """Seralizes an array with the omit_empty option"""
+    item_processor = xml.integer('value')
+
     with pytest.warns(UserWarning):
         # Should get a warning when specifying omit_empty for required arrays
-        xml.dictionary('root', [
-            xml.string('message'),
-            xml.array(xml.integer('value'), nested='data', omit_empty=True)
-        ])
+        xml.array(item_processor, nested='data', omit_empty=True)
 
 
 def test_array_serialize_omit_empty_present():
@@ -239,10 +356,7 @@ def test_array_serialize_omit_empty_present():
         'data': [3, 17],
     }
 
-    processor = xml.dictionary('root', [
-        xml.string('message'),
-        xml.array(xml.integer('value', required=False), nested='data', omit_empty=True)
-    ])
+    processor = _ARRAY_OMIT_EMPTY_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -259,16 +373,6 @@ def test_array_serialize_omit_empty_present():
     assert expected == actual
 
 
-def test_array_serialize_missing_root():
-    """Serialize a missing array"""
-    value = []
-
-    processor = xml.array(xml.integer('value'), nested='data')
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_array_serialize_nested():
     """Tests serializing nested arrays"""
     value = {
@@ -396,16 +500,6 @@ def test_array_serialize_root():
     assert expected == actual
 
 
-def test_array_serialize_root_not_nested():
-    """Serialize an array that is the root"""
-    value = [3.14, 13.7, 6.22]
-
-    processor = xml.array(xml.floating_point('constant'))
-
-    with pytest.raises(xml.InvalidRootProcessor):
-        xml.serialize_to_string(processor, value)
-
-
 def test_array_serialize_shared_element():
     """Serialize an array on an element shared with an attribute"""
     value = {
@@ -483,10 +577,7 @@ def test_attribute_serialize_default_missing():
         'data': 123,
     }
 
-    processor = xml.dictionary('root', [
-        xml.integer('data'),
-        xml.string('data', attribute='units', required=False, default='feet')
-    ])
+    processor = _ATTRIBUTE_DEFAULT_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -506,10 +597,7 @@ def test_attribute_serialize_default_present():
         'units': 'miles'
     }
 
-    processor = xml.dictionary('root', [
-        xml.integer('data'),
-        xml.string('data', attribute='units', required=False, default='feet')
-    ])
+    processor = _ATTRIBUTE_DEFAULT_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -552,10 +640,7 @@ def test_attribute_serialize_falsey_omitted():
         'data': 123,
     }
 
-    processor = xml.dictionary('root', [
-        xml.integer('data'),
-        xml.string('data', attribute='message', required=False, omit_empty=True)
-    ])
+    processor = _ATTRIBUTE_OMIT_EMPTY_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -568,31 +653,13 @@ def test_attribute_serialize_falsey_omitted():
     assert expected == actual
 
 
-def test_attribute_serialize_missing():
-    """Serialize a missing attribute value"""
-    value = {
-        'data': 123,
-    }
-
-    processor = xml.dictionary('root', [
-        xml.integer('data'),
-        xml.string('data', attribute='units')
-    ])
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_attribute_serialize_missing_empty():
     """Tests serializing a Falsey attribute value"""
     value = {
         'data': 123,
     }
 
-    processor = xml.dictionary('root', [
-        xml.integer('data'),
-        xml.string('data', attribute='message', required=False, omit_empty=True)
-    ])
+    processor = _ATTRIBUTE_OMIT_EMPTY_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -633,18 +700,6 @@ def test_attribute_serialize_multiple():
     assert expected == actual
 
 
-def test_dictionary_serialize_root_empty():
-    """Serliazes an empty root dictionary"""
-    value = {}
-
-    processor = xml.dictionary('root', [
-        xml.string('message')
-    ])
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_dictionary_serialize_nested():
     """Serializes nested dictionaries"""
     value = {
@@ -659,17 +714,7 @@ def test_dictionary_serialize_nested():
         }
     }
 
-    processor = xml.dictionary('root', [
-        xml.string('name'),
-        xml.dictionary('demographics', [
-            xml.integer('age'),
-            xml.string('gender')
-        ]),
-        xml.dictionary('favorites', [
-            xml.string('food'),
-            xml.string('color')
-        ])
-    ])
+    processor = _NESTED_DICTIONARY_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -723,32 +768,6 @@ def test_dictionary_serialize_nested_aliased():
     assert expected == actual
 
 
-def test_dictionary_serialize_nested_missing():
-    """Serializes nested dictionaries"""
-    value = {
-        'name': 'John Doe',
-        'demographics': {
-            'age': 27,
-            'gender': 'male',
-        },
-    }
-
-    processor = xml.dictionary('root', [
-        xml.string('name'),
-        xml.dictionary('demographics', [
-            xml.integer('age'),
-            xml.string('gender')
-        ]),
-        xml.dictionary('favorites', [
-            xml.string('food'),
-            xml.string('color')
-        ])
-    ])
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_dictionary_serialize_nested_missing_optional():
     """Serializes nested dictionaries"""
     value = {
@@ -893,9 +912,7 @@ def test_primitive_serialize_default_missing():
         'number': 898,
     }
 
-    processor = xml.dictionary('root', [
-        xml.string('message', required=False, default='Hello, World'),
-    ])
+    processor = _PRIMITIVE_DEFAULT_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -914,9 +931,7 @@ def test_primitive_serialize_default_present():
         'message': 'Hola, Mars'
     }
 
-    processor = xml.dictionary('root', [
-        xml.string('message', required=False, default='Hello, World'),
-    ])
+    processor = _PRIMITIVE_DEFAULT_PROCESSOR
 
     expected = strip_xml("""
     <root>
@@ -929,21 +944,6 @@ def test_primitive_serialize_default_present():
     assert expected == actual
 
 
-def test_primitive_serialize_missing():
-    """Serializes a missing primitive value"""
-    value = {
-        'data': 1
-    }
-
-    processor = xml.dictionary('root', [
-        xml.string('message'),
-        xml.integer('data')
-    ])
-
-    with pytest.raises(xml.MissingValue):
-        xml.serialize_to_string(processor, value)
-
-
 def test_primitive_serialize_missing_omitted():
     """Serializes a missing primitive value"""
     value = {
@@ -966,40 +966,13 @@ def test_primitive_serialize_missing_omitted():
     assert expected == actual
 
 
-def test_primitive_serialize_root():
-    """Serialize a primitive value as the root of the document"""
-    value = 'Hello'
-
-    processor = xml.string('message')
-
-    with pytest.raises(xml.InvalidRootProcessor):
-        xml.serialize_to_string(processor, value)
-
-
 def test_primitive_values_serialize():
     """Serializes primitive values"""
-    value = {
-        'boolean': True,
-        'float': 3.14,
-        'int': 1,
-        'string': 'Hello, World'
-    }
+    value = _PRIMITIVE_VALUES
 
-    processor = xml.dictionary('root', [
-        xml.boolean('boolean'),
-        xml.floating_point('float'),
-        xml.integer('int'),
-        xml.string('string'),
-    ])
+    processor = _PRIMITIVE_VALUES_PROCESSOR
 
-    expected = strip_xml("""
-    <root>
-        <boolean>True</boolean>
-        <float>3.14</float>
-        <int>1</int>
-        <string>Hello, World</string>
-    </root>
-    """)
+    expected = _PRIMITIVE_VALUES_XML_STRING
 
     actual = xml.serialize_to_string(processor, value)
 
@@ -1086,6 +1059,13 @@ def test_primitive_values_serialize_none_default():
     assert expected == actual
 
 
+@pytest.mark.parametrize('processor, value, exception_type', _INVALID_SERIALIZATION_CASES)
+def test_serialize_invalid(processor, value, exception_type):
+    """Serialize values that are missing or cannot be serialized by their processor"""
+    with pytest.raises(exception_type):
+        xml.serialize_to_string(processor, value)
+
+
 def test_serialize_pretty():
     """Serialize a pretty-formatted XML string"""
     value = {
@@ -1112,28 +1092,11 @@ def test_serialize_pretty():
 
 def test_serialize_to_file(tmpdir):
     """Serialize XML data to a file"""
-    value = {
-        'boolean': True,
-        'float': 3.14,
-        'int': 1,
-        'string': 'Hello, World'
-    }
+    value = _PRIMITIVE_VALUES
 
-    processor = xml.dictionary('root', [
-        xml.boolean('boolean'),
-        xml.floating_point('float'),
-        xml.integer('int'),
-        xml.string('string'),
-    ])
+    processor = _PRIMITIVE_VALUES_PROCESSOR
 
-    expected = strip_xml("""
-    <root>
-        <boolean>True</boolean>
-        <float>3.14</float>
-        <int>1</int>
-        <string>Hello, World</string>
-    </root>
-    """)
+    expected = _PRIMITIVE_VALUES_XML_STRING
 
     xml_file_name = 'data.xml'
     xml_file_path = os.path.join(tmpdir.strpath, xml_file_name)
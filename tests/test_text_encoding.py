@@ -32,6 +32,17 @@ _ENCODINGS = [
     'gb18030',
 ]
 
+# Contents of an XML file containing the XML string in each encoding
+_XML_BYTES = {encoding: _XML_STRING.encode(encoding) for encoding in _ENCODINGS}
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-16'])
+def test_parse_from_bytes(encoding):
+    """Parse the encoded bytes of an XML document"""
+    actual = xml.parse_from_string(_PROCESSOR, _XML_BYTES[encoding])
+
+    assert _VALUE == actual
+
 
 def test_parse_from_string():
     """Parse a unicode string"""
@@ -44,7 +55,7 @@ def test_parse_from_string():
 def test_parse_from_file(tmpdir, encoding):
     """Tests parsing an XML file"""
     xml_file = tmpdir.join('data.xml')
-    xml_file.write_text(_XML_STRING, encoding)
+    xml_file.write_binary(_XML_BYTES[encoding])
 
     actual = xml.parse_from_file(_PROCESSOR, xml_file.strpath, encoding=encoding)
 
@@ -59,9 +70,9 @@ def test_serialize_to_file(tmpdir, encoding):
     xml.serialize_to_file(_PROCESSOR, _VALUE, xml_file_path, encoding=encoding)
 
     xml_file = tmpdir.join(xml_file_name)
-    actual = xml_file.read_text(encoding)
+    actual = xml_file.read_binary()
 
-    assert _XML_STRING == actual
+    assert _XML_BYTES[encoding] == actual
 
 
 @pytest.mark.parametrize('encoding', _ENCODINGS)